@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Dict, List
 
 import asyncpg
 import twitchio
-from twitchio.ext import commands, routines
+from twitchio.ext import commands
 
 from utils.checks import is_mod
 
@@ -22,9 +22,15 @@ class CustomCommands(commands.Cog):
     def __init__(self, bot: AlueBot):
         self.bot: AlueBot = bot
         self.cmd_cache: Dict[int, Dict[str, str]] = dict()
-        self.populate_cache.start()
+        self._cache_ready: bool = False
+
+    @commands.Cog.event()  # type: ignore # one day they will fix it  
+    async def event_ready(self):
+        # `ready` fires on every IRC reconnect, but the cache only needs filling once
+        if not self._cache_ready:
+            await self.populate_cache()
+            self._cache_ready = True
 
-    @routines.routine(iterations=1)
     async def populate_cache(self):
         query = """ SELECT user_id, cmd_name, cmd_text
                     FROM twitch_commands
@@ -104,7 +110,15 @@ class CustomCommands(commands.Cog):
             for _k, v in self.bot.commands.items()
             if not v._checks and not isinstance(v, commands.Group)
         ]
-        await ctx.send(", ".join(cache_list + bot_cmds))
+        # twitch cuts chat messages at 500 characters so pack the list into as few messages as possible
+        chunks: List[str] = []
+        for name in cache_list + bot_cmds:
+            if chunks and len(chunks[-1]) + len(name) + 2 <= 500:
+                chunks[-1] += f", {name}"
+            else:
+                chunks.append(name)
+        for chunk in chunks:
+            await ctx.send(chunk)
 
 
 def prepare(bot: AlueBot):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 import twitchio
 from twitchio.ext import commands
@@ -15,6 +15,16 @@ if TYPE_CHECKING:
 class Meta(commands.Cog):
     def __init__(self, bot: AlueBot):
         self.bot: AlueBot = bot
+        self.user_id_cache: Dict[str, int] = dict()
+
+    async def get_user_id(self, channel: twitchio.Channel) -> int:
+        """Channel name -> user id, only asking Helix the first time we see the name"""
+        name = channel.name.lower()
+        user_id = self.user_id_cache.get(name)
+        if user_id is None:
+            user_id = (await channel.user()).id
+            self.user_id_cache[name] = user_id
+        return user_id
 
     @commands.Cog.event()  # type: ignore # one day they will fix it  
     async def event_ready(self):
@@ -40,7 +50,7 @@ class Meta(commands.Cog):
                     (user_id, user_name)
                     VALUES ($1, $2)
                 """
-        await self.bot.pool.execute(query, (await channel.user()).id, channel.name)
+        await self.bot.pool.execute(query, await self.get_user_id(channel), channel.name)
         await ctx.send(f"Added the channel {channel.name}.")
 
     @is_aluerie()
@@ -49,7 +59,9 @@ class Meta(commands.Cog):
         query = """ DELETE FROM twitch_users 
                     WHERE user_id=$1
                 """
-        await self.bot.pool.execute(query, (await channel.user()).id)
+        await self.bot.pool.execute(query, await self.get_user_id(channel))
+        # forget the name in case the login gets renamed and later claimed by someone else
+        self.user_id_cache.pop(channel.name.lower(), None)
         await ctx.send(f"Deleted the channel {channel.name}")
 
 
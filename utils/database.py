@@ -26,8 +26,11 @@ async def create_pool() -> asyncpg.Pool:
     return await asyncpg.create_pool(
         POSTGRES_URL,
         command_timeout=60,
-        min_size=10,
-        max_size=10,
+        # low traffic bot - a couple of warm connections is plenty
+        min_size=2,
+        max_size=5,
+        max_inactive_connection_lifetime=300,
         record_class=DRecord,
+        # keep prepared statements off: they break behind pgbouncer in transaction/statement pooling mode
         statement_cache_size=0,
     ) # type: ignore